@@ -3,24 +3,67 @@ Pytest Configuration and Fixtures for Furiosa QA Automation
 """
 
 import os
+import signal
+import socket
 import subprocess
 import sys
 import time
+from typing import List, Literal, Optional
 
+import httpx
+import orjson
 import pytest
-import requests
-
-# Add mock_server to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "mock_server"))
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, ValidationError
 
+from mock_server.main import app
 
 # ============================================================================
 # Configuration
 # ============================================================================
 
-BASE_URL = "http://localhost:8000"
+BASE_PORT = 8000
+INPROCESS_BASE_URL = "http://testserver"
 STARTUP_TIMEOUT = 10
 SHUTDOWN_TIMEOUT = 5
+# Furiosa-specific metrics every /metrics exposition must contain
+REQUIRED_METRICS = frozenset(
+    {
+        "furiosa_llm_num_requests_running",
+        "furiosa_llm_num_requests_waiting",
+        "furiosa_llm_request_received_total",
+        "furiosa_llm_request_success_total",
+        "furiosa_llm_prompt_tokens_total",
+        "furiosa_llm_generation_tokens_total",
+        "furiosa_llm_kv_cache_usage_perc",
+    }
+)
+POLL_INITIAL_DELAY = 0.01
+POLL_MAX_DELAY = 0.2
+# uvloop is not available on Windows
+SERVER_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+
+
+# ============================================================================
+# Command Line Options
+# ============================================================================
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--subprocess-server",
+        action="store_true",
+        default=False,
+        help="Run the mock server as a uvicorn subprocess on port 8000 "
+        "(8000 + N for xdist worker gwN) instead of calling the ASGI app in-process",
+    )
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="Share MockSamplingParams instances built with identical kwargs "
+        "across the session (off by default so every test gets a fresh instance)",
+    )
 
 
 # ============================================================================
@@ -29,11 +72,26 @@ SHUTDOWN_TIMEOUT = 5
 
 
 @pytest.fixture(scope="session")
-def mock_server():
+def mock_server(request):
     """
-    Start mock server for the entire test session.
-    Automatically starts before tests and stops after all tests complete.
+    Provide the mock server for the entire test session.
+    By default the ASGI app is called in-process (no socket, no subprocess).
+    With --subprocess-server, uvicorn is started before tests and stopped
+    after all tests complete.
     """
+    if not request.config.getoption("--subprocess-server"):
+        yield INPROCESS_BASE_URL
+        return
+
+    # Each xdist worker gets its own port (gw0 -> 8000, gw1 -> 8001, ...)
+    port = BASE_PORT + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:])
+    server_url = f"http://localhost:{port}"
+
+    # A server left over from an earlier run would answer /health in place of
+    # the one started here, so refuse to run against it
+    if _port_in_use(port):
+        raise RuntimeError(f"Port {port} is already in use (stale mock server?)")
+
     # Start the server
     server_process = subprocess.Popen(
         [
@@ -44,48 +102,89 @@ def mock_server():
             "--host",
             "0.0.0.0",
             "--port",
-            "8000",
+            str(port),
+            "--loop",
+            SERVER_LOOP,
+            "--http",
+            "httptools",
+            "--no-access-log",
+            "--log-level",
+            "warning",
         ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         cwd=os.path.dirname(__file__),
+        # Own process group, so teardown can stop uvicorn and any children
+        start_new_session=True,
     )
 
-    # Wait for server to be ready
-    start_time = time.time()
-    while time.time() - start_time < STARTUP_TIMEOUT:
-        try:
-            response = requests.get(f"{BASE_URL}/health", timeout=1)
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
-            time.sleep(0.5)
-    else:
-        server_process.terminate()
-        raise RuntimeError("Mock server failed to start")
-
-    yield BASE_URL
-
-    # Cleanup: Stop the server
-    server_process.terminate()
+    # Stop the server however the session ends, even if startup fails
     try:
-        server_process.wait(timeout=SHUTDOWN_TIMEOUT)
-    except subprocess.TimeoutExpired:
-        server_process.kill()
+        _wait_for_server(server_process, server_url)
+        yield server_url
+    finally:
+        _stop_server_process(server_process)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base_url(mock_server):
     """Provide base URL for API tests"""
     return mock_server
 
 
-@pytest.fixture
-def api_client(base_url):
-    """Provide configured requests session"""
-    session = requests.Session()
-    session.headers.update({"Content-Type": "application/json"})
-    return session, base_url
+@pytest.fixture(scope="session")
+def api_client(request, base_url):
+    """
+    Provide configured HTTP client.
+    Shared across the session so connections are reused between tests.
+    """
+    if request.config.getoption("--subprocess-server"):
+        # Keep-alive pool sized for the whole suite; no transport-level retries
+        transport = httpx.HTTPTransport(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            retries=0,
+        )
+        client = httpx.Client(transport=transport)
+    else:
+        # Unhandled server errors become 500 responses, as with a real server
+        client = TestClient(app, base_url=base_url, raise_server_exceptions=False)
+    client.headers.update({"Content-Type": "application/json"})
+    with client:
+        yield client, base_url
+
+
+@pytest.fixture(scope="session")
+def metrics_text(api_client):
+    """
+    Fetch /metrics once per session.
+    The mock payload is deterministic, so every metrics test shares one response.
+    Returns (status_code, text).
+    """
+    session, base_url = api_client
+    response = session.get(f"{base_url}/metrics")
+    return response.status_code, response.text
+
+
+@pytest.fixture(scope="session")
+def models_list(api_client):
+    """
+    Fetch /v1/models once per session.
+    Returns (status_code, parsed JSON body).
+    """
+    session, base_url = api_client
+    response = session.get(f"{base_url}/v1/models")
+    return response.status_code, parse_json(response)
+
+
+@pytest.fixture(scope="session")
+def version_info(api_client):
+    """
+    Fetch /version once per session.
+    Returns (status_code, parsed JSON body).
+    """
+    session, base_url = api_client
+    response = session.get(f"{base_url}/version")
+    return response.status_code, parse_json(response)
 
 
 @pytest.fixture
@@ -115,11 +214,93 @@ def invalid_model_request():
     }
 
 
+# ============================================================================
+# Response Schemas
+# ============================================================================
+
+
+class ModelInfoSchema(BaseModel):
+    """Required fields of a /v1/models entry (present, may be null)"""
+
+    id: str
+    object: Literal["model"]
+    # Furiosa-specific extensions
+    artifact_id: Optional[str]
+    max_prompt_len: Optional[int]
+    max_context_len: Optional[int]
+
+
+class ModelsListSchema(BaseModel):
+    """Body of GET /v1/models"""
+
+    object: Literal["list"]
+    data: List[ModelInfoSchema]
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
 
+def parse_json(response: httpx.Response):
+    """Decode a JSON response body with orjson (faster than response.json())"""
+    return orjson.loads(response.content)
+
+
+def _port_in_use(port: int) -> bool:
+    """Whether uvicorn would fail to bind port (same address and options)"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(("0.0.0.0", port))
+        except OSError:
+            return True
+    return False
+
+
+def _wait_for_server(process: subprocess.Popen, server_url: str):
+    """Poll /health until the server answers (fast first, then back off)"""
+    start_time = time.time()
+    delay = POLL_INITIAL_DELAY
+    while time.time() - start_time < STARTUP_TIMEOUT:
+        # Only trust /health while our own process is still alive
+        if process.poll() is not None:
+            raise RuntimeError(
+                f"Mock server exited during startup (code {process.returncode})"
+            )
+        try:
+            response = httpx.get(f"{server_url}/health", timeout=0.2)
+            if response.status_code in (200, 204):
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 1.5, POLL_MAX_DELAY)
+    raise RuntimeError("Mock server failed to start")
+
+
+def _signal_server_process(process: subprocess.Popen, sig: int):
+    """Send sig to the server's process group (the process itself on Windows)"""
+    try:
+        if sys.platform == "win32":
+            process.send_signal(sig)
+        else:
+            # start_new_session=True makes the server its own group leader
+            os.killpg(process.pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def _stop_server_process(process: subprocess.Popen):
+    """Stop the server with SIGTERM, escalating to SIGKILL after a timeout"""
+    _signal_server_process(process, signal.SIGTERM)
+    try:
+        process.wait(timeout=SHUTDOWN_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        _signal_server_process(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+        process.wait()
+
+
 def assert_valid_chat_response(response_json: dict):
     """Assert that response has valid chat completion structure"""
     assert "id" in response_json
@@ -141,12 +322,9 @@ def assert_valid_completion_response(response_json: dict):
     assert "usage" in response_json
 
 
-def assert_valid_model_info(model_info: dict):
-    """Assert that model info has required fields"""
-    assert "id" in model_info
-    assert "object" in model_info
-    assert model_info["object"] == "model"
-    # Furiosa-specific extensions
-    assert "artifact_id" in model_info
-    assert "max_prompt_len" in model_info
-    assert "max_context_len" in model_info
+def assert_valid_models_list(response_json: dict):
+    """Assert that a /v1/models body and every model in it match the schema"""
+    try:
+        ModelsListSchema.model_validate(response_json)
+    except ValidationError as exc:
+        pytest.fail(f"Invalid /v1/models response:\n{exc}")
@@ -4,19 +4,21 @@ Based on Furiosa SDK 2025.3.1 API Specification
 https://developer.furiosa.ai/latest/en/furiosa_llm/furiosa-llm-serve.html
 """
 
-import json
+import itertools
 import time
-import uuid
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 app = FastAPI(
     title="Furiosa LLM Mock Server",
     description="Mock server for Furiosa LLM OpenAI-Compatible API testing",
     version="2025.3.1",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -65,30 +67,33 @@ class CompletionRequest(BaseModel):
     min_tokens: int = 0
 
 
-class ChatCompletionChoice(BaseModel):
+# Response payloads are plain dicts (TypedDict), serialized directly by orjson
+
+
+class ChatCompletionChoice(TypedDict):
     index: int
-    message: ChatMessage
+    message: Dict[str, str]
     finish_reason: str
 
 
-class ChatCompletionResponse(BaseModel):
+class ChatCompletionResponse(TypedDict):
     id: str
-    object: str = "chat.completion"
+    object: str
     created: int
     model: str
     choices: List[ChatCompletionChoice]
     usage: Dict[str, int]
 
 
-class CompletionChoice(BaseModel):
+class CompletionChoice(TypedDict):
     index: int
     text: str
     finish_reason: str
 
 
-class CompletionResponse(BaseModel):
+class CompletionResponse(TypedDict):
     id: str
-    object: str = "text_completion"
+    object: str
     created: int
     model: str
     choices: List[CompletionChoice]
@@ -122,10 +127,12 @@ class VersionInfo(BaseModel):
 # Mock Data
 # ============================================================================
 
+BOOT_TIMESTAMP = int(time.time())
+
 MOCK_MODELS = [
     ModelInfo(
         id="furiosa-ai/Llama-3.1-8B-Instruct-FP8",
-        created=int(time.time()),
+        created=BOOT_TIMESTAMP,
         artifact_id="llama-3.1-8b-instruct-fp8-v1",
         max_prompt_len=4096,
         max_context_len=8192,
@@ -133,7 +140,7 @@ MOCK_MODELS = [
     ),
     ModelInfo(
         id="furiosa-ai/DeepSeek-R1-Distill-Llama-8B",
-        created=int(time.time()),
+        created=BOOT_TIMESTAMP,
         artifact_id="deepseek-r1-distill-llama-8b-v1",
         max_prompt_len=4096,
         max_context_len=8192,
@@ -141,17 +148,53 @@ MOCK_MODELS = [
     ),
 ]
 
+# Precomputed at import: O(1) lookup by id and ready-to-send JSON bodies
+MODELS_INDEX = {model.id: orjson.dumps(model.model_dump()) for model in MOCK_MODELS}
+MODELS_BODY = orjson.dumps(ModelsResponse(data=MOCK_MODELS).model_dump())
+
 VERSION_INFO = VersionInfo(
     furiosa_llm="0.1.0", furiosa_compiler="2025.3.1", furiosa_runtime="2025.3.1"
 )
 
 
+# Prometheus text exposition format
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4"
+METRICS_BODY = """# HELP furiosa_llm_num_requests_running Number of requests running on RNGD
+# TYPE furiosa_llm_num_requests_running gauge
+furiosa_llm_num_requests_running{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 0
+
+# HELP furiosa_llm_num_requests_waiting Number of requests waiting to be processed
+# TYPE furiosa_llm_num_requests_waiting gauge
+furiosa_llm_num_requests_waiting{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 0
+
+# HELP furiosa_llm_request_received_total Number of received requests in total
+# TYPE furiosa_llm_request_received_total counter
+furiosa_llm_request_received_total{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 100
+
+# HELP furiosa_llm_request_success_total Number of successfully processed requests
+# TYPE furiosa_llm_request_success_total counter
+furiosa_llm_request_success_total{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 98
+
+# HELP furiosa_llm_prompt_tokens_total Total number of prefill tokens processed
+# TYPE furiosa_llm_prompt_tokens_total counter
+furiosa_llm_prompt_tokens_total{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 15000
+
+# HELP furiosa_llm_generation_tokens_total Total number of generation tokens processed
+# TYPE furiosa_llm_generation_tokens_total counter
+furiosa_llm_generation_tokens_total{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 8500
+
+# HELP furiosa_llm_kv_cache_usage_perc KV-cache usage percentage
+# TYPE furiosa_llm_kv_cache_usage_perc gauge
+furiosa_llm_kv_cache_usage_perc{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8",device_index="0"} 0.45
+"""
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
 
 
-@app.post("/v1/chat/completions", response_model=ChatCompletionResponse)
+@app.post("/v1/chat/completions")
 async def chat_completions(request: ChatCompletionRequest):
     """
     Chat Completion API - OpenAI Compatible
@@ -164,28 +207,31 @@ async def chat_completions(request: ChatCompletionRequest):
 
     # Mock response generation
     response_content = generate_mock_response(request.messages[-1].content)
+    prompt_tokens = sum(len(m.content.split()) for m in request.messages)
+    completion_tokens = len(response_content.split())
 
-    return ChatCompletionResponse(
-        id=f"chatcmpl-{uuid.uuid4().hex[:8]}",
+    response = ChatCompletionResponse(
+        id=generate_id("chatcmpl"),
+        object="chat.completion",
         created=int(time.time()),
         model=request.model,
         choices=[
             ChatCompletionChoice(
                 index=0,
-                message=ChatMessage(role="assistant", content=response_content),
+                message={"role": "assistant", "content": response_content},
                 finish_reason="stop",
             )
         ],
         usage={
-            "prompt_tokens": sum(len(m.content.split()) for m in request.messages),
-            "completion_tokens": len(response_content.split()),
-            "total_tokens": sum(len(m.content.split()) for m in request.messages)
-            + len(response_content.split()),
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
         },
     )
+    return ORJSONResponse(content=response)
 
 
-@app.post("/v1/completions", response_model=CompletionResponse)
+@app.post("/v1/completions")
 async def completions(request: CompletionRequest):
     """
     Completions API - OpenAI Compatible
@@ -197,37 +243,41 @@ async def completions(request: CompletionRequest):
         )
 
     response_text = generate_mock_response(request.prompt)
+    prompt_tokens = len(request.prompt.split())
+    completion_tokens = len(response_text.split())
 
-    return CompletionResponse(
-        id=f"cmpl-{uuid.uuid4().hex[:8]}",
+    response = CompletionResponse(
+        id=generate_id("cmpl"),
+        object="text_completion",
         created=int(time.time()),
         model=request.model,
         choices=[CompletionChoice(index=0, text=response_text, finish_reason="stop")],
         usage={
-            "prompt_tokens": len(request.prompt.split()),
-            "completion_tokens": len(response_text.split()),
-            "total_tokens": len(request.prompt.split()) + len(response_text.split()),
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
         },
     )
+    return ORJSONResponse(content=response)
 
 
-@app.get("/v1/models", response_model=ModelsResponse)
+@app.get("/v1/models")
 async def list_models():
     """
     List available models
     """
-    return ModelsResponse(data=MOCK_MODELS)
+    return Response(content=MODELS_BODY, media_type="application/json")
 
 
-@app.get("/v1/models/{model_id:path}", response_model=ModelInfo)
+@app.get("/v1/models/{model_id:path}")
 async def get_model(model_id: str):
     """
     Get specific model information
     """
-    for model in MOCK_MODELS:
-        if model.id == model_id:
-            return model
-    raise HTTPException(status_code=404, detail=f"Model '{model_id}' not found")
+    body = MODELS_INDEX.get(model_id)
+    if body is None:
+        raise HTTPException(status_code=404, detail=f"Model '{model_id}' not found")
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/version")
@@ -238,48 +288,20 @@ async def get_version():
     return VERSION_INFO
 
 
-@app.get("/metrics")
+@app.get("/metrics", response_class=PlainTextResponse)
 async def get_metrics():
     """
     Prometheus-compatible metrics endpoint
     """
-    metrics = """# HELP furiosa_llm_num_requests_running Number of requests running on RNGD
-# TYPE furiosa_llm_num_requests_running gauge
-furiosa_llm_num_requests_running{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 0
-
-# HELP furiosa_llm_num_requests_waiting Number of requests waiting to be processed
-# TYPE furiosa_llm_num_requests_waiting gauge
-furiosa_llm_num_requests_waiting{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 0
-
-# HELP furiosa_llm_request_received_total Number of received requests in total
-# TYPE furiosa_llm_request_received_total counter
-furiosa_llm_request_received_total{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 100
-
-# HELP furiosa_llm_request_success_total Number of successfully processed requests
-# TYPE furiosa_llm_request_success_total counter
-furiosa_llm_request_success_total{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 98
-
-# HELP furiosa_llm_prompt_tokens_total Total number of prefill tokens processed
-# TYPE furiosa_llm_prompt_tokens_total counter
-furiosa_llm_prompt_tokens_total{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 15000
-
-# HELP furiosa_llm_generation_tokens_total Total number of generation tokens processed
-# TYPE furiosa_llm_generation_tokens_total counter
-furiosa_llm_generation_tokens_total{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8"} 8500
-
-# HELP furiosa_llm_kv_cache_usage_perc KV-cache usage percentage
-# TYPE furiosa_llm_kv_cache_usage_perc gauge
-furiosa_llm_kv_cache_usage_perc{model_name="furiosa-ai/Llama-3.1-8B-Instruct-FP8",device_index="0"} 0.45
-"""
-    return metrics
+    return PlainTextResponse(METRICS_BODY, media_type=METRICS_CONTENT_TYPE)
 
 
 @app.get("/health")
 async def health_check():
     """
-    Health check endpoint
+    Health check endpoint (bodyless 204, cheap enough for tight readiness polling)
     """
-    return {"status": "healthy"}
+    return Response(status_code=204)
 
 
 # ============================================================================
@@ -287,66 +309,100 @@ async def health_check():
 # ============================================================================
 
 
+# (keywords, response): first rule whose keywords all appear in the prompt wins
+MOCK_RESPONSE_RULES = (
+    (("capital", "france"), "The capital of France is Paris."),
+    (("weather",), "I'm an AI and don't have access to real-time weather data."),
+    (("hello",), "Hello! How can I assist you today?"),
+    (("hi",), "Hello! How can I assist you today?"),
+)
+
+
+@lru_cache(maxsize=512)
 def generate_mock_response(prompt: str) -> str:
-    """Generate mock response based on prompt"""
-    if "capital" in prompt.lower() and "france" in prompt.lower():
-        return "The capital of France is Paris."
-    elif "weather" in prompt.lower():
-        return "I'm an AI and don't have access to real-time weather data."
-    elif "hello" in prompt.lower() or "hi" in prompt.lower():
-        return "Hello! How can I assist you today?"
-    else:
-        return f"This is a mock response from Furiosa LLM. Your prompt was: {prompt[:50]}..."
-
-
-async def generate_chat_stream(request: ChatCompletionRequest):
-    """Generate streaming response for chat completions"""
-    response_content = generate_mock_response(request.messages[-1].content)
-    words = response_content.split()
+    """Generate mock response based on prompt (cached per unique prompt)"""
+    lowered = prompt.lower()
+    for keywords, response in MOCK_RESPONSE_RULES:
+        if all(keyword in lowered for keyword in keywords):
+            return response
+    return (
+        f"This is a mock response from Furiosa LLM. Your prompt was: {prompt[:50]}..."
+    )
 
-    for i, word in enumerate(words):
-        chunk = {
-            "id": f"chatcmpl-{uuid.uuid4().hex[:8]}",
-            "object": "chat.completion.chunk",
-            "created": int(time.time()),
-            "model": request.model,
-            "choices": [
-                {
-                    "index": 0,
-                    "delta": {"content": word + " " if i < len(words) - 1 else word},
-                    "finish_reason": None if i < len(words) - 1 else "stop",
-                }
-            ],
-        }
-        yield f"data: {json.dumps(chunk)}\n\n"
 
-    yield "data: [DONE]\n\n"
+_id_counter = itertools.count()
 
 
-async def generate_completion_stream(request: CompletionRequest):
-    """Generate streaming response for completions"""
-    response_text = generate_mock_response(request.prompt)
-    words = response_text.split()
+def generate_id(prefix: str) -> str:
+    """Generate a unique response id (cheap counter, no entropy needed for a mock)"""
+    return f"{prefix}-{next(_id_counter):08x}"
 
+
+def _dumps(value: Any) -> str:
+    """Encode a single JSON value for an SSE chunk"""
+    return orjson.dumps(value).decode()
+
+
+async def _generate_word_stream(
+    text: str,
+    model: str,
+    id_prefix: str,
+    object_name: str,
+    content_path: Tuple[str, ...],
+):
+    """
+    Stream text word by word as SSE chunks of the given object type.
+    content_path is the key path of the per-word field inside a choice,
+    e.g. ("delta", "content") for chat or ("text",) for completions.
+    """
+    words = text.split()
+
+    # All chunks of one response share the same id and created timestamp,
+    # so everything up to the per-word fields is encoded once
+    prefix = '{"id":%s,"object":%s,"created":%d,"model":%s,"choices":[{"index":0,' % (
+        _dumps(generate_id(id_prefix)),
+        _dumps(object_name),
+        int(time.time()),
+        _dumps(model),
+    )
+    # Open the nested per-word field, e.g. '"delta":{"content":'
+    prefix += ":{".join(_dumps(key) for key in content_path) + ":"
+    close = "}" * (len(content_path) - 1)
+    suffix = close + ',"finish_reason":null}]}'
+    last_suffix = close + ',"finish_reason":"stop"}]}'
+
+    last = len(words) - 1
     for i, word in enumerate(words):
-        chunk = {
-            "id": f"cmpl-{uuid.uuid4().hex[:8]}",
-            "object": "text_completion.chunk",
-            "created": int(time.time()),
-            "model": request.model,
-            "choices": [
-                {
-                    "index": 0,
-                    "text": word + " " if i < len(words) - 1 else word,
-                    "finish_reason": None if i < len(words) - 1 else "stop",
-                }
-            ],
-        }
-        yield f"data: {json.dumps(chunk)}\n\n"
+        if i < last:
+            yield f"data: {prefix}{_dumps(word + ' ')}{suffix}\n\n"
+        else:
+            yield f"data: {prefix}{_dumps(word)}{last_suffix}\n\n"
 
     yield "data: [DONE]\n\n"
 
 
+def generate_chat_stream(request: ChatCompletionRequest):
+    """Generate streaming response for chat completions"""
+    return _generate_word_stream(
+        generate_mock_response(request.messages[-1].content),
+        request.model,
+        "chatcmpl",
+        "chat.completion.chunk",
+        ("delta", "content"),
+    )
+
+
+def generate_completion_stream(request: CompletionRequest):
+    """Generate streaming response for completions"""
+    return _generate_word_stream(
+        generate_mock_response(request.prompt),
+        request.model,
+        "cmpl",
+        "text_completion.chunk",
+        ("text",),
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
 
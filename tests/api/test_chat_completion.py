@@ -12,15 +12,15 @@ Covers:
 import json
 
 import pytest
-import requests
 
 from conftest import assert_valid_chat_response
 
+pytestmark = pytest.mark.api
+
 
 class TestChatCompletionBasic:
     """Basic Chat Completion API Tests"""
 
-    @pytest.mark.api
     @pytest.mark.smoke
     def test_chat_completion_basic(self, api_client, sample_chat_request):
         """Test basic chat completion request"""
@@ -34,7 +34,6 @@ class TestChatCompletionBasic:
         response_json = response.json()
         assert_valid_chat_response(response_json)
 
-    @pytest.mark.api
     def test_chat_completion_response_content(self, api_client, sample_chat_request):
         """Test that response contains meaningful content"""
         session, base_url = api_client
@@ -49,7 +48,6 @@ class TestChatCompletionBasic:
         assert len(content) > 0
         assert "Paris" in content  # Expected answer for France capital
 
-    @pytest.mark.api
     def test_chat_completion_finish_reason(self, api_client, sample_chat_request):
         """Test that finish_reason is properly set"""
         session, base_url = api_client
@@ -63,7 +61,6 @@ class TestChatCompletionBasic:
 
         assert finish_reason in ["stop", "length", "tool_calls"]
 
-    @pytest.mark.api
     def test_chat_completion_usage_tokens(self, api_client, sample_chat_request):
         """Test that usage tokens are properly counted"""
         session, base_url = api_client
@@ -86,29 +83,11 @@ class TestChatCompletionBasic:
 class TestChatCompletionParameters:
     """Test Chat Completion API Parameters"""
 
-    @pytest.mark.api
-    @pytest.mark.parametrize("temperature", [0.0, 0.5, 1.0, 2.0])
-    def test_chat_completion_temperature(
-        self, api_client, sample_chat_request, temperature
-    ):
-        """Test different temperature values"""
-        session, base_url = api_client
-
-        sample_chat_request["temperature"] = temperature
-
-        response = session.post(
-            f"{base_url}/v1/chat/completions", json=sample_chat_request
-        )
-
-        assert response.status_code == 200
-
-    @pytest.mark.api
-    @pytest.mark.parametrize("top_p", [0.1, 0.5, 0.9, 1.0])
-    def test_chat_completion_top_p(self, api_client, sample_chat_request, top_p):
-        """Test different top_p values"""
+    def test_chat_completion_sampling_params(self, api_client, sample_chat_request):
+        """Test temperature, top_p and top_k (Furiosa-specific) in one request"""
         session, base_url = api_client
 
-        sample_chat_request["top_p"] = top_p
+        sample_chat_request.update({"temperature": 0.5, "top_p": 0.5, "top_k": 10})
 
         response = session.post(
             f"{base_url}/v1/chat/completions", json=sample_chat_request
@@ -116,13 +95,20 @@ class TestChatCompletionParameters:
 
         assert response.status_code == 200
 
-    @pytest.mark.api
-    @pytest.mark.parametrize("top_k", [-1, 10, 50, 100])
-    def test_chat_completion_top_k(self, api_client, sample_chat_request, top_k):
-        """Test different top_k values (Furiosa-specific parameter)"""
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "param, value",
+        [("temperature", value) for value in [0.0, 0.5, 1.0, 2.0]]
+        + [("top_p", value) for value in [0.1, 0.5, 0.9, 1.0]]
+        + [("top_k", value) for value in [-1, 10, 50, 100]],
+    )
+    def test_chat_completion_sampling_param_sweep(
+        self, api_client, sample_chat_request, param, value
+    ):
+        """Test each sampling parameter value individually (slow)"""
         session, base_url = api_client
 
-        sample_chat_request["top_k"] = top_k
+        sample_chat_request[param] = value
 
         response = session.post(
             f"{base_url}/v1/chat/completions", json=sample_chat_request
@@ -130,7 +116,6 @@ class TestChatCompletionParameters:
 
         assert response.status_code == 200
 
-    @pytest.mark.api
     def test_chat_completion_max_tokens(self, api_client, sample_chat_request):
         """Test max_tokens parameter"""
         session, base_url = api_client
@@ -143,7 +128,6 @@ class TestChatCompletionParameters:
 
         assert response.status_code == 200
 
-    @pytest.mark.api
     def test_chat_completion_max_completion_tokens(
         self, api_client, sample_chat_request
     ):
@@ -162,25 +146,23 @@ class TestChatCompletionParameters:
 class TestChatCompletionStreaming:
     """Test Chat Completion Streaming"""
 
-    @pytest.mark.api
+    @pytest.mark.slow
+    @pytest.mark.timeout(30)
     def test_chat_completion_stream(self, api_client, sample_chat_request):
         """Test streaming chat completion"""
         session, base_url = api_client
 
         sample_chat_request["stream"] = True
 
-        response = session.post(
-            f"{base_url}/v1/chat/completions", json=sample_chat_request, stream=True
-        )
-
-        assert response.status_code == 200
+        with session.stream(
+            "POST", f"{base_url}/v1/chat/completions", json=sample_chat_request
+        ) as response:
+            assert response.status_code == 200
 
-        chunks = []
-        for line in response.iter_lines():
-            if line:
-                line_str = line.decode("utf-8")
-                if line_str.startswith("data: "):
-                    data = line_str[6:]
+            chunks = []
+            for line in response.iter_lines():
+                if line.startswith("data: "):
+                    data = line[6:]
                     if data != "[DONE]":
                         chunks.append(json.loads(data))
 
@@ -192,7 +174,6 @@ class TestChatCompletionStreaming:
 class TestChatCompletionMultiTurn:
     """Test Multi-turn Conversations"""
 
-    @pytest.mark.api
     def test_chat_completion_multi_turn(self, api_client):
         """Test multi-turn conversation"""
         session, base_url = api_client
@@ -212,7 +193,6 @@ class TestChatCompletionMultiTurn:
         response_json = response.json()
         assert_valid_chat_response(response_json)
 
-    @pytest.mark.api
     def test_chat_completion_system_message(self, api_client):
         """Test chat completion with system message"""
         session, base_url = api_client
@@ -14,11 +14,12 @@ import pytest
 
 from conftest import assert_valid_completion_response
 
+pytestmark = pytest.mark.api
+
 
 class TestCompletionsBasic:
     """Basic Completions API Tests"""
 
-    @pytest.mark.api
     @pytest.mark.smoke
     def test_completion_basic(self, api_client, sample_completion_request):
         """Test basic completion request"""
@@ -32,7 +33,6 @@ class TestCompletionsBasic:
         response_json = response.json()
         assert_valid_completion_response(response_json)
 
-    @pytest.mark.api
     def test_completion_response_text(self, api_client, sample_completion_request):
         """Test that response contains generated text"""
         session, base_url = api_client
@@ -46,7 +46,6 @@ class TestCompletionsBasic:
 
         assert len(text) > 0
 
-    @pytest.mark.api
     def test_completion_finish_reason(self, api_client, sample_completion_request):
         """Test that finish_reason is properly set"""
         session, base_url = api_client
@@ -60,7 +59,6 @@ class TestCompletionsBasic:
 
         assert finish_reason in ["stop", "length"]
 
-    @pytest.mark.api
     def test_completion_usage_tokens(self, api_client, sample_completion_request):
         """Test that usage tokens are properly counted"""
         session, base_url = api_client
@@ -80,15 +78,11 @@ class TestCompletionsBasic:
 class TestCompletionsParameters:
     """Test Completions API Parameters"""
 
-    @pytest.mark.api
-    @pytest.mark.parametrize("max_tokens", [16, 50, 100, 256])
-    def test_completion_max_tokens(
-        self, api_client, sample_completion_request, max_tokens
-    ):
-        """Test different max_tokens values"""
+    def test_completion_sampling_params(self, api_client, sample_completion_request):
+        """Test max_tokens and temperature in one request"""
         session, base_url = api_client
 
-        sample_completion_request["max_tokens"] = max_tokens
+        sample_completion_request.update({"max_tokens": 50, "temperature": 0.5})
 
         response = session.post(
             f"{base_url}/v1/completions", json=sample_completion_request
@@ -96,15 +90,19 @@ class TestCompletionsParameters:
 
         assert response.status_code == 200
 
-    @pytest.mark.api
-    @pytest.mark.parametrize("temperature", [0.0, 0.5, 1.0])
-    def test_completion_temperature(
-        self, api_client, sample_completion_request, temperature
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "param, value",
+        [("max_tokens", value) for value in [16, 50, 100, 256]]
+        + [("temperature", value) for value in [0.0, 0.5, 1.0]],
+    )
+    def test_completion_sampling_param_sweep(
+        self, api_client, sample_completion_request, param, value
     ):
-        """Test different temperature values"""
+        """Test each sampling parameter value individually (slow)"""
         session, base_url = api_client
 
-        sample_completion_request["temperature"] = temperature
+        sample_completion_request[param] = value
 
         response = session.post(
             f"{base_url}/v1/completions", json=sample_completion_request
@@ -112,7 +110,6 @@ class TestCompletionsParameters:
 
         assert response.status_code == 200
 
-    @pytest.mark.api
     def test_completion_min_tokens(self, api_client, sample_completion_request):
         """Test min_tokens parameter"""
         session, base_url = api_client
@@ -129,25 +126,23 @@ class TestCompletionsParameters:
 class TestCompletionsStreaming:
     """Test Completions Streaming"""
 
-    @pytest.mark.api
+    @pytest.mark.slow
+    @pytest.mark.timeout(30)
     def test_completion_stream(self, api_client, sample_completion_request):
         """Test streaming completion"""
         session, base_url = api_client
 
         sample_completion_request["stream"] = True
 
-        response = session.post(
-            f"{base_url}/v1/completions", json=sample_completion_request, stream=True
-        )
-
-        assert response.status_code == 200
+        with session.stream(
+            "POST", f"{base_url}/v1/completions", json=sample_completion_request
+        ) as response:
+            assert response.status_code == 200
 
-        chunks = []
-        for line in response.iter_lines():
-            if line:
-                line_str = line.decode("utf-8")
-                if line_str.startswith("data: "):
-                    data = line_str[6:]
+            chunks = []
+            for line in response.iter_lines():
+                if line.startswith("data: "):
+                    data = line[6:]
                     if data != "[DONE]":
                         chunks.append(json.loads(data))
 
@@ -11,139 +11,105 @@ import re
 
 import pytest
 
-
+from conftest import REQUIRED_METRICS
+
+pytestmark = pytest.mark.api
+
+# Strings the presence tests look for, collected in a single scan of the body.
+# No needle is a prefix of another, so one alternation finds them all.
+MODEL_NAME_LABEL = "model_name="
+METRIC_NEEDLES = (*sorted(REQUIRED_METRICS), MODEL_NAME_LABEL)
+# Zero-width lookahead so overlapping needles are all reported
+METRIC_NEEDLES_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(needle) for needle in METRIC_NEEDLES) + "))"
+)
+METRIC_NEEDLES_OVERLAP = max(len(needle) for needle in METRIC_NEEDLES) - 1
+
+# (name, type) captured from every "# TYPE <name> <type>" line at once
+TYPE_LINE_PATTERN = re.compile(
+    r"^# TYPE (\S+) (counter|gauge|histogram|summary|untyped)$", re.MULTILINE
+)
+EXPECTED_METRIC_TYPES = (
+    ("furiosa_llm_num_requests_running", "gauge"),
+    ("furiosa_llm_request_received_total", "counter"),
+)
+DIGIT_PATTERN = re.compile(r"\d")
+
+
+@pytest.fixture(scope="module")
+def metrics_presence(api_client):
+    """
+    Set of METRIC_NEEDLES present in the metrics body.
+    The body is streamed and scanning stops as soon as every needle is seen,
+    so a large exposition never has to be materialized in full.
+    """
+    session, base_url = api_client
+    found = set()
+    tail = ""
+    with session.stream("GET", f"{base_url}/metrics") as response:
+        for chunk in response.iter_text(chunk_size=8192):
+            # Carry the end of the previous chunk so split needles still match
+            window = tail + chunk
+            found.update(m.group(1) for m in METRIC_NEEDLES_PATTERN.finditer(window))
+            if len(found) == len(METRIC_NEEDLES):
+                break
+            tail = window[-METRIC_NEEDLES_OVERLAP:]
+    return found
+
+
+@pytest.fixture(scope="module")
+def metrics_types(metrics_text):
+    """Mapping of metric name to type from all TYPE lines, parsed in one pass"""
+    _, text = metrics_text
+    return dict(TYPE_LINE_PATTERN.findall(text))
+
+
+@pytest.mark.xdist_group("metrics")
 class TestMetricsAPI:
     """Metrics API Tests"""
 
-    @pytest.mark.api
     @pytest.mark.smoke
-    def test_metrics_endpoint(self, api_client):
+    def test_metrics_endpoint(self, metrics_text):
         """Test metrics endpoint returns 200"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/metrics")
+        status_code, _ = metrics_text
 
-        assert response.status_code == 200
+        assert status_code == 200
 
-    @pytest.mark.api
-    def test_metrics_prometheus_format(self, api_client):
+    def test_metrics_prometheus_format(self, metrics_text):
         """Test metrics are in Prometheus format"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/metrics")
-        metrics_text = response.text
+        _, text = metrics_text
 
         # Prometheus format should have HELP and TYPE comments
-        assert "# HELP" in metrics_text
-        assert "# TYPE" in metrics_text
-
-    @pytest.mark.api
-    def test_metrics_contains_requests_running(self, api_client):
-        """Test metrics contains furiosa_llm_num_requests_running"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/metrics")
-        metrics_text = response.text
-
-        assert "furiosa_llm_num_requests_running" in metrics_text
-
-    @pytest.mark.api
-    def test_metrics_contains_requests_waiting(self, api_client):
-        """Test metrics contains furiosa_llm_num_requests_waiting"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/metrics")
-        metrics_text = response.text
-
-        assert "furiosa_llm_num_requests_waiting" in metrics_text
-
-    @pytest.mark.api
-    def test_metrics_contains_request_total(self, api_client):
-        """Test metrics contains request total counters"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/metrics")
-        metrics_text = response.text
-
-        assert "furiosa_llm_request_received_total" in metrics_text
-        assert "furiosa_llm_request_success_total" in metrics_text
-
-    @pytest.mark.api
-    def test_metrics_contains_token_counters(self, api_client):
-        """Test metrics contains token counters"""
-        session, base_url = api_client
+        assert all(marker in text for marker in ("# HELP", "# TYPE"))
 
-        response = session.get(f"{base_url}/metrics")
-        metrics_text = response.text
+    def test_all_required_metrics_present(self, metrics_presence):
+        """Test metrics contain every Furiosa-specific metric"""
+        missing = REQUIRED_METRICS - metrics_presence
 
-        assert "furiosa_llm_prompt_tokens_total" in metrics_text
-        assert "furiosa_llm_generation_tokens_total" in metrics_text
+        assert not missing, f"Missing metrics: {sorted(missing)}"
 
-    @pytest.mark.api
-    def test_metrics_contains_kv_cache(self, api_client):
-        """Test metrics contains KV cache metrics"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/metrics")
-        metrics_text = response.text
-
-        assert "furiosa_llm_kv_cache_usage_perc" in metrics_text
-
-    @pytest.mark.api
-    def test_metrics_model_name_label(self, api_client):
+    def test_metrics_model_name_label(self, metrics_presence):
         """Test metrics have model_name label"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/metrics")
-        metrics_text = response.text
-
-        # Check for model_name label in metrics (handles escaped quotes)
-        assert "model_name=" in metrics_text
-
-    @pytest.mark.api
-    def test_metrics_gauge_type(self, api_client):
-        """Test that gauge metrics are properly typed"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/metrics")
-        metrics_text = response.text
+        assert MODEL_NAME_LABEL in metrics_presence
 
-        # num_requests_running should be gauge type
-        assert "# TYPE furiosa_llm_num_requests_running gauge" in metrics_text
-
-    @pytest.mark.api
-    def test_metrics_counter_type(self, api_client):
-        """Test that counter metrics are properly typed"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/metrics")
-        metrics_text = response.text
-
-        # request_received_total should be counter type
-        assert "# TYPE furiosa_llm_request_received_total counter" in metrics_text
+    @pytest.mark.parametrize("name, metric_type", EXPECTED_METRIC_TYPES)
+    def test_metrics_type(self, metrics_types, name, metric_type):
+        """Test that gauge/counter metrics are properly typed"""
+        assert metrics_types.get(name) == metric_type
 
 
+@pytest.mark.xdist_group("metrics")
 class TestMetricsParsing:
     """Test Metrics Value Parsing"""
 
-    @pytest.mark.api
-    def test_metrics_numeric_values(self, api_client):
+    def test_metrics_numeric_values(self, metrics_text):
         """Test that metric values are numeric"""
-        session, base_url = api_client
+        _, text = metrics_text
 
-        response = session.get(f"{base_url}/metrics")
-        metrics_text = response.text
+        # Metrics should contain numeric values (stops at the first digit)
+        assert DIGIT_PATTERN.search(text) is not None
 
-        # Metrics should contain numeric values
-        assert any(char.isdigit() for char in metrics_text)
-
-    @pytest.mark.api
-    def test_metrics_kv_cache_percentage_range(self, api_client):
+    def test_metrics_kv_cache_percentage_range(self, metrics_presence):
         """Test KV cache usage percentage exists in metrics"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/metrics")
-        metrics_text = response.text
-
         # Just verify the metric exists
-        assert "furiosa_llm_kv_cache_usage_perc" in metrics_text
+        assert "furiosa_llm_kv_cache_usage_perc" in metrics_presence
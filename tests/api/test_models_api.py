@@ -10,47 +10,40 @@ Covers:
 
 import pytest
 
-from conftest import assert_valid_model_info
+from conftest import assert_valid_models_list
 
+pytestmark = pytest.mark.api
 
+
+@pytest.mark.xdist_group("models")
 class TestModelsAPI:
     """Models API Tests"""
 
-    @pytest.mark.api
     @pytest.mark.smoke
-    def test_list_models(self, api_client):
+    def test_list_models(self, models_list):
         """Test listing all available models"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/v1/models")
+        status_code, response_json = models_list
 
-        assert response.status_code == 200
-        response_json = response.json()
+        assert status_code == 200
 
         assert "object" in response_json
         assert response_json["object"] == "list"
         assert "data" in response_json
         assert len(response_json["data"]) > 0
 
-    @pytest.mark.api
-    def test_list_models_structure(self, api_client):
+    def test_list_models_structure(self, models_list):
         """Test that each model has required fields"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/v1/models")
-        response_json = response.json()
+        _, response_json = models_list
 
-        for model in response_json["data"]:
-            assert_valid_model_info(model)
+        assert_valid_models_list(response_json)
 
-    @pytest.mark.api
-    def test_get_specific_model(self, api_client):
+    def test_get_specific_model(self, api_client, models_list):
         """Test getting a specific model by ID"""
         session, base_url = api_client
 
         # First, get list of models
-        list_response = session.get(f"{base_url}/v1/models")
-        models = list_response.json()["data"]
+        _, models_json = models_list
+        models = models_json["data"]
 
         # Get first model by ID
         model_id = models[0]["id"]
@@ -60,7 +53,6 @@ class TestModelsAPI:
         model = response.json()
         assert model["id"] == model_id
 
-    @pytest.mark.api
     def test_get_nonexistent_model(self, api_client):
         """Test getting a model that doesn't exist"""
         session, base_url = api_client
@@ -70,56 +62,28 @@ class TestModelsAPI:
         assert response.status_code == 404
 
 
+@pytest.mark.xdist_group("models")
 class TestFuriosaModelExtensions:
     """Test Furiosa-specific Model Extensions"""
 
-    @pytest.mark.api
-    def test_model_artifact_id(self, api_client):
-        """Test that models have artifact_id (Furiosa extension)"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/v1/models")
-        models = response.json()["data"]
-
-        for model in models:
-            assert "artifact_id" in model
-            assert model["artifact_id"] is not None
-
-    @pytest.mark.api
-    def test_model_max_prompt_len(self, api_client):
-        """Test that models have max_prompt_len (Furiosa extension)"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/v1/models")
-        models = response.json()["data"]
-
-        for model in models:
-            assert "max_prompt_len" in model
-            assert isinstance(model["max_prompt_len"], int)
-            assert model["max_prompt_len"] > 0
-
-    @pytest.mark.api
-    def test_model_max_context_len(self, api_client):
-        """Test that models have max_context_len (Furiosa extension)"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/v1/models")
-        models = response.json()["data"]
-
-        for model in models:
-            assert "max_context_len" in model
-            assert isinstance(model["max_context_len"], int)
-            assert model["max_context_len"] >= model["max_prompt_len"]
-
-    @pytest.mark.api
-    def test_model_runtime_config(self, api_client):
-        """Test that models have runtime_config (Furiosa extension)"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/v1/models")
-        models = response.json()["data"]
+    def test_model_furiosa_extensions(self, models_list):
+        """
+        Test that models have artifact_id, max_prompt_len, max_context_len
+        and runtime_config (Furiosa extensions), checked in a single pass
+        """
+        _, models_json = models_list
+        models = models_json["data"]
 
         for model in models:
-            assert "runtime_config" in model
-            if model["runtime_config"]:
-                assert isinstance(model["runtime_config"], dict)
+            artifact_id = model["artifact_id"]
+            max_prompt_len = model["max_prompt_len"]
+            max_context_len = model["max_context_len"]
+            runtime_config = model["runtime_config"]
+
+            assert artifact_id is not None
+            assert isinstance(max_prompt_len, int)
+            assert max_prompt_len > 0
+            assert isinstance(max_context_len, int)
+            assert max_context_len >= max_prompt_len
+            if runtime_config:
+                assert isinstance(runtime_config, dict)
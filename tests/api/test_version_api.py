@@ -9,62 +9,35 @@ Covers:
 
 import pytest
 
+pytestmark = pytest.mark.api
 
+
+@pytest.mark.xdist_group("version")
 class TestVersionAPI:
     """Version API Tests"""
 
-    @pytest.mark.api
     @pytest.mark.smoke
-    def test_version_endpoint(self, api_client):
+    def test_version_endpoint(self, version_info):
         """Test version endpoint returns 200"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/version")
-
-        assert response.status_code == 200
-
-    @pytest.mark.api
-    def test_version_contains_furiosa_llm(self, api_client):
-        """Test version contains furiosa_llm version"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/version")
-        version_info = response.json()
+        status_code, _ = version_info
 
-        assert "furiosa_llm" in version_info
-        assert version_info["furiosa_llm"] is not None
+        assert status_code == 200
 
-    @pytest.mark.api
-    def test_version_contains_compiler(self, api_client):
-        """Test version contains furiosa_compiler version"""
-        session, base_url = api_client
+    @pytest.mark.parametrize(
+        "key", ["furiosa_llm", "furiosa_compiler", "furiosa_runtime"]
+    )
+    def test_version_contains(self, version_info, key):
+        """Test version contains each SDK component version"""
+        _, versions = version_info
 
-        response = session.get(f"{base_url}/version")
-        version_info = response.json()
+        assert key in versions
+        assert versions[key] is not None
 
-        assert "furiosa_compiler" in version_info
-        assert version_info["furiosa_compiler"] is not None
-
-    @pytest.mark.api
-    def test_version_contains_runtime(self, api_client):
-        """Test version contains furiosa_runtime version"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/version")
-        version_info = response.json()
-
-        assert "furiosa_runtime" in version_info
-        assert version_info["furiosa_runtime"] is not None
-
-    @pytest.mark.api
-    def test_version_format(self, api_client):
+    def test_version_format(self, version_info):
         """Test that version strings are in valid format"""
-        session, base_url = api_client
-
-        response = session.get(f"{base_url}/version")
-        version_info = response.json()
+        _, versions = version_info
 
-        for key, value in version_info.items():
+        for key, value in versions.items():
             assert isinstance(value, str)
             # Version should contain at least one dot (e.g., "0.1.0" or "2025.3.1")
-            assert "." in value or value.isdigit()
+            assert "." in value or value.isdigit(), f"{key}: {value!r}"
@@ -11,52 +11,40 @@ Covers:
 
 import pytest
 
+pytestmark = pytest.mark.error
 
-class TestInvalidRequests:
-    """Test Invalid Request Handling"""
-
-    @pytest.mark.error
-    def test_missing_messages_field(self, api_client):
-        """Test chat completion without messages field"""
-        session, base_url = api_client
-
-        response = session.post(
-            f"{base_url}/v1/chat/completions", json={"model": "test"}
-        )
-
-        # Should return 422 Unprocessable Entity
-        assert response.status_code == 422
+CHAT_COMPLETIONS_PATH = "/v1/chat/completions"
+COMPLETIONS_PATH = "/v1/completions"
+USER_MESSAGE = {"role": "user", "content": "Hello"}
 
-    @pytest.mark.error
-    def test_missing_model_field(self, api_client):
-        """Test chat completion without model field"""
-        session, base_url = api_client
 
-        response = session.post(
-            f"{base_url}/v1/chat/completions",
-            json={"messages": [{"role": "user", "content": "Hello"}]},
-        )
-
-        # Should return 422 Unprocessable Entity
-        assert response.status_code == 422
+class TestInvalidRequests:
+    """Test Invalid Request Handling"""
 
-    @pytest.mark.error
-    def test_missing_prompt_field(self, api_client):
-        """Test completion without prompt field"""
+    @pytest.mark.parametrize(
+        "path, body",
+        [
+            (CHAT_COMPLETIONS_PATH, {"model": "test"}),
+            (CHAT_COMPLETIONS_PATH, {"messages": [USER_MESSAGE]}),
+            (COMPLETIONS_PATH, {"model": "test"}),
+        ],
+        ids=["missing_messages", "missing_model", "missing_prompt"],
+    )
+    def test_missing_required_field(self, api_client, path, body):
+        """Test requests without a required field"""
         session, base_url = api_client
 
-        response = session.post(f"{base_url}/v1/completions", json={"model": "test"})
+        response = session.post(f"{base_url}{path}", json=body)
 
         # Should return 422 Unprocessable Entity
         assert response.status_code == 422
 
-    @pytest.mark.error
     def test_empty_messages_array(self, api_client):
         """Test chat completion with empty messages array"""
         session, base_url = api_client
 
         response = session.post(
-            f"{base_url}/v1/chat/completions", json={"model": "test", "messages": []}
+            f"{base_url}{CHAT_COMPLETIONS_PATH}", json={"model": "test", "messages": []}
         )
 
         # Empty messages might cause various error codes
@@ -66,60 +54,30 @@ class TestInvalidRequests:
 class TestInvalidParameterTypes:
     """Test Invalid Parameter Type Handling"""
 
-    @pytest.mark.error
-    def test_invalid_temperature_type(self, api_client):
-        """Test chat completion with invalid temperature type"""
-        session, base_url = api_client
-
-        response = session.post(
-            f"{base_url}/v1/chat/completions",
-            json={
-                "model": "test",
-                "messages": [{"role": "user", "content": "Hello"}],
-                "temperature": "hot",  # Should be float
-            },
-        )
-
-        assert response.status_code == 422
-
-    @pytest.mark.error
-    def test_invalid_max_tokens_type(self, api_client):
-        """Test chat completion with invalid max_tokens type"""
-        session, base_url = api_client
-
-        response = session.post(
-            f"{base_url}/v1/chat/completions",
-            json={
-                "model": "test",
-                "messages": [{"role": "user", "content": "Hello"}],
-                "max_tokens": "many",  # Should be int
-            },
-        )
-
-        assert response.status_code == 422
-
-    @pytest.mark.error
-    def test_invalid_stream_type(self, api_client):
-        """Test chat completion with invalid stream type"""
+    @pytest.mark.parametrize(
+        "field, value, expected_status",
+        [
+            ("temperature", "hot", {422}),  # Should be float
+            ("max_tokens", "many", {422}),  # Should be int
+            # Pydantic may coerce "yes" to True, so accept 200 or 422
+            ("stream", "yes", {200, 422}),
+        ],
+    )
+    def test_invalid_parameter_type(self, api_client, field, value, expected_status):
+        """Test chat completion with a wrongly typed parameter"""
         session, base_url = api_client
 
         response = session.post(
-            f"{base_url}/v1/chat/completions",
-            json={
-                "model": "test",
-                "messages": [{"role": "user", "content": "Hello"}],
-                "stream": "yes",  # Should be bool
-            },
+            f"{base_url}{CHAT_COMPLETIONS_PATH}",
+            json={"model": "test", "messages": [USER_MESSAGE], field: value},
         )
 
-        # Pydantic may coerce "yes" to True, so accept 200 or 422
-        assert response.status_code in [200, 422]
+        assert response.status_code in expected_status
 
 
 class TestNonExistentEndpoints:
     """Test Non-Existent Endpoint Handling"""
 
-    @pytest.mark.error
     def test_nonexistent_endpoint(self, api_client):
         """Test request to non-existent endpoint"""
         session, base_url = api_client
@@ -128,7 +86,6 @@ class TestNonExistentEndpoints:
 
         assert response.status_code == 404
 
-    @pytest.mark.error
     def test_nonexistent_model(self, api_client):
         """Test getting non-existent model"""
         session, base_url = api_client
@@ -141,17 +98,15 @@ class TestNonExistentEndpoints:
 class TestInvalidHTTPMethods:
     """Test Invalid HTTP Method Handling"""
 
-    @pytest.mark.error
     def test_get_chat_completions(self, api_client):
         """Test GET request to POST-only endpoint"""
         session, base_url = api_client
 
-        response = session.get(f"{base_url}/v1/chat/completions")
+        response = session.get(f"{base_url}{CHAT_COMPLETIONS_PATH}")
 
         # Should return 405 Method Not Allowed
         assert response.status_code == 405
 
-    @pytest.mark.error
     def test_post_models(self, api_client):
         """Test POST request to GET-only endpoint"""
         session, base_url = api_client
@@ -165,27 +120,16 @@ class TestInvalidHTTPMethods:
 class TestMalformedJSON:
     """Test Malformed JSON Handling"""
 
-    @pytest.mark.error
-    def test_malformed_json(self, api_client):
-        """Test request with malformed JSON"""
-        session, base_url = api_client
-
-        response = session.post(
-            f"{base_url}/v1/chat/completions",
-            data="not valid json",
-            headers={"Content-Type": "application/json"},
-        )
-
-        assert response.status_code == 422
-
-    @pytest.mark.error
-    def test_empty_body(self, api_client):
-        """Test request with empty body"""
+    @pytest.mark.parametrize(
+        "content", ["not valid json", ""], ids=["malformed_json", "empty_body"]
+    )
+    def test_invalid_json_body(self, api_client, content):
+        """Test request with malformed or empty JSON body"""
         session, base_url = api_client
 
         response = session.post(
-            f"{base_url}/v1/chat/completions",
-            data="",
+            f"{base_url}{CHAT_COMPLETIONS_PATH}",
+            content=content,
             headers={"Content-Type": "application/json"},
         )
 
@@ -7,17 +7,19 @@ In production, these would interface with furiosa.runtime.get_devices()
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from unittest.mock import Mock, patch
 
 import pytest
 
+pytestmark = pytest.mark.sdk
+
 # ============================================================================
 # Mock Device Classes (Simulating furiosa.runtime)
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockDeviceInfo:
     """Simulates furiosa device info"""
 
@@ -28,7 +30,7 @@ class MockDeviceInfo:
     driver_version: str = "2025.3.1"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockDevice:
     """Simulates furiosa NPU device"""
 
@@ -47,27 +49,36 @@ class MockRuntime:
     """Simulates furiosa.runtime module"""
 
     def __init__(self, devices: List[MockDevice] = None):
-        self._devices = devices or []
+        # Device set is fixed for the runtime's lifetime, so freeze it once
+        self._devices = tuple(devices or ())
+        self._available = tuple(d for d in self._devices if d.is_available())
+        self._by_id = {d.device_id: d for d in self._devices}
 
-    def get_devices(self) -> List[MockDevice]:
+    def get_devices(self) -> Tuple[MockDevice, ...]:
         return self._devices
 
-    def list_devices(self) -> List[MockDevice]:
+    def list_devices(self) -> Tuple[MockDevice, ...]:
         return self._devices
 
+    def available_devices(self) -> Tuple[MockDevice, ...]:
+        return self._available
+
+    def get_device(self, device_id: int) -> Optional[MockDevice]:
+        return self._by_id.get(device_id)
+
 
 # ============================================================================
 # Test Fixtures
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_single_device():
     """Single NPU device"""
     return MockRuntime([MockDevice(device_id=0, info=MockDeviceInfo(name="npu0"))])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_multiple_devices():
     """Multiple NPU devices"""
     return MockRuntime(
@@ -80,13 +91,13 @@ def mock_multiple_devices():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_no_devices():
     """No NPU devices"""
     return MockRuntime([])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_unavailable_device():
     """Device that is not available"""
     return MockRuntime(
@@ -102,7 +113,6 @@ def mock_unavailable_device():
 class TestDeviceDetection:
     """Test NPU Device Detection"""
 
-    @pytest.mark.sdk
     def test_detect_single_device(self, mock_single_device):
         """Test detecting a single NPU device"""
         devices = mock_single_device.get_devices()
@@ -110,7 +120,6 @@ class TestDeviceDetection:
         assert len(devices) == 1
         assert devices[0].device_info().name == "npu0"
 
-    @pytest.mark.sdk
     def test_detect_multiple_devices(self, mock_multiple_devices):
         """Test detecting multiple NPU devices"""
         devices = mock_multiple_devices.get_devices()
@@ -119,14 +128,12 @@ class TestDeviceDetection:
         for i, device in enumerate(devices):
             assert device.device_info().name == f"npu{i}"
 
-    @pytest.mark.sdk
     def test_no_devices_available(self, mock_no_devices):
         """Test behavior when no NPU devices are found"""
         devices = mock_no_devices.get_devices()
 
         assert len(devices) == 0
 
-    @pytest.mark.sdk
     def test_device_info_properties(self, mock_single_device):
         """Test device info properties"""
         devices = mock_single_device.get_devices()
@@ -141,25 +148,21 @@ class TestDeviceDetection:
 class TestDeviceAvailability:
     """Test Device Availability Checks"""
 
-    @pytest.mark.sdk
     def test_device_is_available(self, mock_single_device):
         """Test that device reports as available"""
         devices = mock_single_device.get_devices()
 
         assert devices[0].is_available() is True
 
-    @pytest.mark.sdk
     def test_device_is_unavailable(self, mock_unavailable_device):
         """Test that busy device reports as unavailable"""
         devices = mock_unavailable_device.get_devices()
 
         assert devices[0].is_available() is False
 
-    @pytest.mark.sdk
     def test_filter_available_devices(self, mock_multiple_devices):
         """Test filtering for available devices only"""
-        devices = mock_multiple_devices.get_devices()
-        available = [d for d in devices if d.is_available()]
+        available = mock_multiple_devices.available_devices()
 
         assert len(available) == 4
 
@@ -167,34 +170,28 @@ class TestDeviceAvailability:
 class TestDeviceSelection:
     """Test Device Selection Logic"""
 
-    @pytest.mark.sdk
     def test_select_first_available_device(self, mock_multiple_devices):
         """Test selecting first available device"""
-        devices = mock_multiple_devices.get_devices()
-        available = [d for d in devices if d.is_available()]
+        available = mock_multiple_devices.available_devices()
 
         if available:
             selected = available[0]
             assert selected.device_id == 0
 
-    @pytest.mark.sdk
     def test_select_device_by_id(self, mock_multiple_devices):
         """Test selecting device by specific ID"""
-        devices = mock_multiple_devices.get_devices()
         target_id = 2
 
-        selected = next((d for d in devices if d.device_id == target_id), None)
+        selected = mock_multiple_devices.get_device(target_id)
 
         assert selected is not None
         assert selected.device_id == target_id
 
-    @pytest.mark.sdk
     def test_device_not_found_by_id(self, mock_multiple_devices):
         """Test selecting non-existent device ID"""
-        devices = mock_multiple_devices.get_devices()
         target_id = 999
 
-        selected = next((d for d in devices if d.device_id == target_id), None)
+        selected = mock_multiple_devices.get_device(target_id)
 
         assert selected is None
 
@@ -202,7 +199,6 @@ class TestDeviceSelection:
 class TestDeviceNamingConvention:
     """Test Device Naming Convention"""
 
-    @pytest.mark.sdk
     def test_device_name_format(self, mock_multiple_devices):
         """Test that device names follow npu{N} format"""
         devices = mock_multiple_devices.get_devices()
@@ -214,7 +210,6 @@ class TestDeviceNamingConvention:
             npu_index = int(name[3:])
             assert npu_index >= 0
 
-    @pytest.mark.sdk
     def test_device_index_matches_name(self, mock_multiple_devices):
         """Test that device_id matches name index"""
         devices = mock_multiple_devices.get_devices()
@@ -6,17 +6,36 @@ Based on Furiosa LLM SamplingParams specification:
 https://developer.furiosa.ai/latest/en/furiosa_llm/reference/sampling_params.html
 """
 
-from dataclasses import dataclass, field
-from typing import Optional
-
+import functools
+import itertools
+import pickle
+from dataclasses import FrozenInstanceError, dataclass, fields
+from operator import attrgetter
+from types import SimpleNamespace
+from typing import Any, Callable, ClassVar, Optional, Tuple
+
+import numpy as np
 import pytest
 
+pytestmark = pytest.mark.sdk
+
 # ============================================================================
 # Mock SamplingParams (Simulating furiosa_llm.SamplingParams)
 # ============================================================================
 
 
-@dataclass
+# Validation error messages, shared by the rule table and the tests
+N_ERROR = "n must be at least 1"
+BEST_OF_ERROR = "best_of must be >= n"
+TEMPERATURE_ERROR = "temperature must be non-negative"
+TOP_P_ERROR = "top_p must be between 0 and 1"
+MIN_P_ERROR = "min_p must be between 0 and 1"
+MAX_TOKENS_ERROR = "max_tokens must be at least 1"
+MIN_TOKENS_ERROR = "min_tokens must be non-negative"
+MIN_TOKENS_RANGE_ERROR = "min_tokens must be <= max_tokens"
+
+
+@dataclass(frozen=True, slots=True)
 class MockSamplingParams:
     """
     Simulates furiosa_llm.SamplingParams
@@ -38,184 +57,312 @@ class MockSamplingParams:
     min_tokens: int = 0
     logprobs: Optional[int] = None
 
+    # (predicate, error message), checked in order; the first failure is raised.
+    # Predicates only use elementwise comparisons so validate_grid can apply
+    # them to whole numpy columns as well as to a single instance.
+    RULES: ClassVar[Tuple[Tuple[Callable[[Any], Any], str], ...]] = (
+        (lambda p: p.n >= 1, N_ERROR),
+        (lambda p: p.best_of >= p.n, BEST_OF_ERROR),
+        (lambda p: p.temperature >= 0, TEMPERATURE_ERROR),
+        (lambda p: p.top_p >= 0, TOP_P_ERROR),
+        (lambda p: p.top_p <= 1, TOP_P_ERROR),
+        (lambda p: p.min_p >= 0, MIN_P_ERROR),
+        (lambda p: p.min_p <= 1, MIN_P_ERROR),
+        (lambda p: p.max_tokens >= 1, MAX_TOKENS_ERROR),
+        (lambda p: p.min_tokens >= 0, MIN_TOKENS_ERROR),
+        (lambda p: p.min_tokens <= p.max_tokens, MIN_TOKENS_RANGE_ERROR),
+    )
+
+    # Column order of the arrays accepted by validate_grid
+    GRID_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "n",
+        "best_of",
+        "temperature",
+        "top_p",
+        "min_p",
+        "max_tokens",
+        "min_tokens",
+    )
+
     def __post_init__(self):
         """Validate parameters after initialization"""
         self._validate()
 
     def _validate(self):
         """Validate parameter values"""
-        if self.n < 1:
-            raise ValueError("n must be at least 1")
-        if self.best_of < self.n:
-            raise ValueError("best_of must be >= n")
-        if self.temperature < 0:
-            raise ValueError("temperature must be non-negative")
-        if not (0 <= self.top_p <= 1):
-            raise ValueError("top_p must be between 0 and 1")
-        if not (0 <= self.min_p <= 1):
-            raise ValueError("min_p must be between 0 and 1")
-        if self.max_tokens < 1:
-            raise ValueError("max_tokens must be at least 1")
-        if self.min_tokens < 0:
-            raise ValueError("min_tokens must be non-negative")
-        if self.min_tokens > self.max_tokens:
-            raise ValueError("min_tokens must be <= max_tokens")
+        for ok, message in self.RULES:
+            if not ok(self):
+                raise ValueError(message)
+
+    @classmethod
+    def from_trusted(cls, **kwargs) -> "MockSamplingParams":
+        """
+        Build an instance without running _validate
+
+        For tests that only check attributes round-trip; unknown names still
+        raise TypeError, as with the regular constructor.
+        """
+        params = cls.__new__(cls)
+        for f in fields(cls):
+            object.__setattr__(params, f.name, kwargs.pop(f.name, f.default))
+        if kwargs:
+            raise TypeError(f"Unexpected SamplingParams fields: {sorted(kwargs)}")
+        return params
+
+    @classmethod
+    def validate_grid(cls, grid: np.ndarray) -> np.ndarray:
+        """
+        Vectorized _validate for parameter sweeps
+
+        grid is an (M, len(GRID_FIELDS)) array with one candidate per row.
+        Returns a boolean mask of the rows that would pass _validate,
+        without constructing M instances.
+        """
+        if grid.ndim != 2 or grid.shape[1] != len(cls.GRID_FIELDS):
+            raise ValueError(
+                f"grid must have shape (M, {len(cls.GRID_FIELDS)}) with columns "
+                f"{cls.GRID_FIELDS}, got {grid.shape}"
+            )
+        columns = SimpleNamespace(**dict(zip(cls.GRID_FIELDS, grid.T)))
+        return np.logical_and.reduce([ok(columns) for ok, _ in cls.RULES])
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+
+def assert_rejected(kwargs: dict, message: str):
+    """Assert that MockSamplingParams(**kwargs) raises a ValueError with message"""
+    try:
+        MockSamplingParams(**kwargs)
+    except ValueError as exc:
+        assert message in str(exc), f"{exc!r} does not contain {message!r}"
+        return
+    pytest.fail(f"ValueError not raised for {kwargs}")
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def make_params(request):
+    """
+    Factory for the validated instances acceptance tests inspect.
+    With --cached, identical kwargs share one instance for the whole session.
+    """
+    if request.config.getoption("--cached"):
+        return functools.lru_cache(maxsize=1024)(MockSamplingParams)
+    return MockSamplingParams
+
+
+@pytest.fixture(scope="session")
+def default_params():
+    """
+    SamplingParams with every field at its default, built once per session.
+    The instance is frozen, so read-only tests can share it in any order and
+    each xdist worker simply builds its own copy.
+    """
+    return MockSamplingParams()
 
 
 # ============================================================================
 # Tests
 # ============================================================================
 
+EXPECTED_DEFAULTS = {
+    "n": 1,
+    "best_of": 1,
+    "temperature": 1.0,
+    "top_p": 1.0,
+    "top_k": -1,
+    "min_p": 0.0,
+    "use_beam_search": False,
+    "max_tokens": 16,
+    "min_tokens": 0,
+}
+
+# Reads all four customized fields in one call, as a tuple in this order
+CUSTOM_FIELDS = attrgetter("temperature", "top_p", "top_k", "max_tokens")
+
+# Small homogeneous sweeps, checked in a loop inside one test item each
+VALID_TEMPERATURES = (0.0, 0.1, 0.5, 1.0, 2.0)
+VALID_TOP_K_VALUES = (1, 10, 50, 100)
+
+# (kwargs on top of use_beam_search=True/best_of=4, attribute, expected value)
+BEAM_SEARCH_CASES = [
+    pytest.param({}, "use_beam_search", True, id="enabled"),
+    pytest.param({}, "best_of", 4, id="best_of"),
+    pytest.param({"length_penalty": 0.8}, "length_penalty", 0.8, id="length_penalty"),
+    pytest.param({"early_stopping": True}, "early_stopping", True, id="early_stopping"),
+]
+
+# (probability field, value just outside [0, 1]) for the shared range check
+PROBABILITY_RANGE_CASES = [
+    ("top_p", 1.5),
+    ("top_p", -0.1),
+    ("min_p", 2.0),
+    ("min_p", -0.5),
+]
+PROBABILITY_RANGE_MESSAGES = {"top_p": TOP_P_ERROR, "min_p": MIN_P_ERROR}
+
+# (constructor kwargs, expected error message) for the remaining validation rules
+INVALID_CASES = [
+    pytest.param({"n": 0}, N_ERROR, id="invalid_n"),
+    pytest.param({"n": 2, "best_of": 1}, BEST_OF_ERROR, id="invalid_best_of"),
+    pytest.param({"temperature": -0.5}, TEMPERATURE_ERROR, id="negative_temperature"),
+    pytest.param({"max_tokens": 0}, MAX_TOKENS_ERROR, id="invalid_max_tokens"),
+    pytest.param({"min_tokens": -1}, MIN_TOKENS_ERROR, id="invalid_min_tokens"),
+    pytest.param(
+        {"min_tokens": 100, "max_tokens": 50},
+        MIN_TOKENS_RANGE_ERROR,
+        id="min_tokens_exceeds_max",
+    ),
+]
+
+
+# SamplingParams default values
+def test_default_values(default_params):
+    """Test that default values are correctly set"""
+    actual = {name: getattr(default_params, name) for name in EXPECTED_DEFAULTS}
+
+    # One comparison; on failure pytest diffs every mismatched field at once
+    assert actual == EXPECTED_DEFAULTS
+
+
+def test_custom_values():
+    """Test setting custom parameter values"""
+    # Pure attribute round-trip; the sweeps below run the real validator
+    params = MockSamplingParams.from_trusted(
+        temperature=0.7, top_p=0.9, top_k=50, max_tokens=100
+    )
+
+    assert CUSTOM_FIELDS(params) == (0.7, 0.9, 50, 100)
+
+
+def test_params_are_immutable(default_params):
+    """Test that shared instances cannot be modified by a test"""
+    with pytest.raises(FrozenInstanceError):
+        default_params.temperature = 0.5
+
+
+def test_params_pickle_round_trip(default_params):
+    """Test that instances survive pickling (e.g. when sent between processes)"""
+    assert pickle.loads(pickle.dumps(default_params)) == default_params
+
+
+# SamplingParams validation
+@pytest.mark.parametrize("kwargs, message", INVALID_CASES)
+def test_invalid(kwargs, message):
+    """Test that out-of-range parameters raise ValueError"""
+    assert_rejected(kwargs, message)
+
+
+@pytest.mark.parametrize("field, value", PROBABILITY_RANGE_CASES)
+def test_probability_out_of_range(field, value):
+    """Test that top_p/min_p outside [0, 1] raise ValueError"""
+    assert_rejected({field: value}, PROBABILITY_RANGE_MESSAGES[field])
+
+
+def test_from_trusted_skips_validation():
+    """Test that from_trusted accepts values the constructor rejects"""
+    params = MockSamplingParams.from_trusted(n=0, temperature=-0.5)
+    assert (params.n, params.temperature) == (0, -0.5)
+
+
+# Temperature parameter behavior
+def test_valid_temperature_values(make_params):
+    """Test various valid temperature values"""
+    for temp in VALID_TEMPERATURES:
+        assert make_params(temperature=temp).temperature == temp, temp
+
+
+def test_zero_temperature(make_params):
+    """Test temperature=0 (greedy decoding)"""
+    params = make_params(temperature=0.0)
+    assert params.temperature == 0.0
+
+
+# top_k parameter behavior
+def test_top_k_disabled(make_params):
+    """Test top_k=-1 (disabled)"""
+    params = make_params(top_k=-1)
+    assert params.top_k == -1
+
+
+def test_valid_top_k_values(make_params):
+    """Test various valid top_k values"""
+    for k in VALID_TOP_K_VALUES:
+        assert make_params(top_k=k).top_k == k, k
+
+
+# Beam search parameters (disabled by default, see test_default_values)
+@pytest.mark.parametrize("extra, attr, expected", BEAM_SEARCH_CASES)
+def test_beam_search(make_params, extra, attr, expected):
+    """Test beam search settings round-trip"""
+    params = make_params(use_beam_search=True, best_of=4, **extra)
+    assert getattr(params, attr) == expected
+
+
+# Vectorized parameter grid validation
+def test_validate_grid_matches_scalar_validation():
+    """Test that validate_grid agrees with per-instance validation"""
+    values = {
+        "n": [0, 1, 2],
+        "best_of": [1, 2],
+        "temperature": [-0.5, 0.0, 1.0],
+        "top_p": [-0.1, 0.5, 1.5],
+        "min_p": [0.0, 2.0],
+        "max_tokens": [0, 16],
+        "min_tokens": [-1, 0, 20],
+    }
+    columns = MockSamplingParams.GRID_FIELDS
+    rows = list(itertools.product(*(values[name] for name in columns)))
 
-class TestSamplingParamsDefaults:
-    """Test SamplingParams Default Values"""
-
-    @pytest.mark.sdk
-    def test_default_values(self):
-        """Test that default values are correctly set"""
-        params = MockSamplingParams()
-
-        assert params.n == 1
-        assert params.best_of == 1
-        assert params.temperature == 1.0
-        assert params.top_p == 1.0
-        assert params.top_k == -1
-        assert params.min_p == 0.0
-        assert params.use_beam_search is False
-        assert params.max_tokens == 16
-        assert params.min_tokens == 0
-
-    @pytest.mark.sdk
-    def test_custom_values(self):
-        """Test setting custom parameter values"""
-        params = MockSamplingParams(
-            temperature=0.7, top_p=0.9, top_k=50, max_tokens=100
-        )
-
-        assert params.temperature == 0.7
-        assert params.top_p == 0.9
-        assert params.top_k == 50
-        assert params.max_tokens == 100
-
-
-class TestSamplingParamsValidation:
-    """Test SamplingParams Validation"""
-
-    @pytest.mark.sdk
-    def test_invalid_n(self):
-        """Test that n < 1 raises error"""
-        with pytest.raises(ValueError, match="n must be at least 1"):
-            MockSamplingParams(n=0)
-
-    @pytest.mark.sdk
-    def test_invalid_best_of(self):
-        """Test that best_of < n raises error"""
-        with pytest.raises(ValueError, match="best_of must be >= n"):
-            MockSamplingParams(n=2, best_of=1)
-
-    @pytest.mark.sdk
-    def test_negative_temperature(self):
-        """Test that negative temperature raises error"""
-        with pytest.raises(ValueError, match="temperature must be non-negative"):
-            MockSamplingParams(temperature=-0.5)
-
-    @pytest.mark.sdk
-    def test_invalid_top_p_high(self):
-        """Test that top_p > 1 raises error"""
-        with pytest.raises(ValueError, match="top_p must be between 0 and 1"):
-            MockSamplingParams(top_p=1.5)
-
-    @pytest.mark.sdk
-    def test_invalid_top_p_low(self):
-        """Test that top_p < 0 raises error"""
-        with pytest.raises(ValueError, match="top_p must be between 0 and 1"):
-            MockSamplingParams(top_p=-0.1)
-
-    @pytest.mark.sdk
-    def test_invalid_min_p(self):
-        """Test that invalid min_p raises error"""
-        with pytest.raises(ValueError, match="min_p must be between 0 and 1"):
-            MockSamplingParams(min_p=2.0)
-
-    @pytest.mark.sdk
-    def test_invalid_max_tokens(self):
-        """Test that max_tokens < 1 raises error"""
-        with pytest.raises(ValueError, match="max_tokens must be at least 1"):
-            MockSamplingParams(max_tokens=0)
-
-    @pytest.mark.sdk
-    def test_invalid_min_tokens(self):
-        """Test that negative min_tokens raises error"""
-        with pytest.raises(ValueError, match="min_tokens must be non-negative"):
-            MockSamplingParams(min_tokens=-1)
-
-    @pytest.mark.sdk
-    def test_min_tokens_exceeds_max(self):
-        """Test that min_tokens > max_tokens raises error"""
-        with pytest.raises(ValueError, match="min_tokens must be <= max_tokens"):
-            MockSamplingParams(min_tokens=100, max_tokens=50)
-
-
-class TestSamplingParamsTemperature:
-    """Test Temperature Parameter Behavior"""
-
-    @pytest.mark.sdk
-    @pytest.mark.parametrize("temp", [0.0, 0.1, 0.5, 1.0, 2.0])
-    def test_valid_temperature_values(self, temp):
-        """Test various valid temperature values"""
-        params = MockSamplingParams(temperature=temp)
-        assert params.temperature == temp
-
-    @pytest.mark.sdk
-    def test_zero_temperature(self):
-        """Test temperature=0 (greedy decoding)"""
-        params = MockSamplingParams(temperature=0.0)
-        assert params.temperature == 0.0
-
-
-class TestSamplingParamsTopK:
-    """Test top_k Parameter Behavior"""
-
-    @pytest.mark.sdk
-    def test_top_k_disabled(self):
-        """Test top_k=-1 (disabled)"""
-        params = MockSamplingParams(top_k=-1)
-        assert params.top_k == -1
-
-    @pytest.mark.sdk
-    @pytest.mark.parametrize("k", [1, 10, 50, 100])
-    def test_valid_top_k_values(self, k):
-        """Test various valid top_k values"""
-        params = MockSamplingParams(top_k=k)
-        assert params.top_k == k
-
-
-class TestSamplingParamsBeamSearch:
-    """Test Beam Search Parameters"""
-
-    @pytest.mark.sdk
-    def test_beam_search_disabled_by_default(self):
-        """Test beam search is disabled by default"""
-        params = MockSamplingParams()
-        assert params.use_beam_search is False
-
-    @pytest.mark.sdk
-    def test_beam_search_enabled(self):
-        """Test enabling beam search"""
-        params = MockSamplingParams(use_beam_search=True, best_of=4)
-        assert params.use_beam_search is True
-        assert params.best_of == 4
-
-    @pytest.mark.sdk
-    def test_beam_search_with_length_penalty(self):
-        """Test beam search with length penalty"""
-        params = MockSamplingParams(use_beam_search=True, best_of=4, length_penalty=0.8)
-        assert params.length_penalty == 0.8
-
-    @pytest.mark.sdk
-    def test_beam_search_with_early_stopping(self):
-        """Test beam search with early stopping"""
-        params = MockSamplingParams(
-            use_beam_search=True, best_of=4, early_stopping=True
-        )
-        assert params.early_stopping is True
+    mask = MockSamplingParams.validate_grid(np.array(rows, dtype=float))
+
+    for row, grid_valid in zip(rows, mask):
+        try:
+            MockSamplingParams(**dict(zip(columns, row)))
+            scalar_valid = True
+        except ValueError:
+            scalar_valid = False
+        assert grid_valid == scalar_valid, dict(zip(columns, row))
+
+
+@pytest.mark.parametrize(
+    "shape",
+    [(1, 8), (1, 6), (7,)],
+    ids=["extra_column", "missing_column", "single_row_1d"],
+)
+def test_validate_grid_rejects_wrong_shape(shape):
+    """Test that a grid not laid out as (M, len(GRID_FIELDS)) is rejected"""
+    with pytest.raises(ValueError, match="grid must have shape"):
+        MockSamplingParams.validate_grid(np.ones(shape))
+
+
+def test_sweep_constructs_only_accepted_rows():
+    """Test a wide sweep, building instances only for rows validate_grid accepts"""
+    values = {
+        "n": [0, 1, 2, 4],
+        "best_of": [1, 2, 4, 8],
+        "temperature": [-1.0, 0.0, 0.5, 1.0, 2.0],
+        "top_p": [-0.1, 0.0, 0.5, 1.0, 1.1],
+        "min_p": [-0.1, 0.0, 0.5, 1.0, 1.1],
+        "max_tokens": [0, 1, 16, 256],
+        "min_tokens": [-1, 0, 8, 512],
+    }
+    columns = MockSamplingParams.GRID_FIELDS
+    rows = list(itertools.product(*(values[name] for name in columns)))
+
+    # 32,000 candidates are filtered in one vectorized pass; only the accepted
+    # 1,620 are constructed, each of which must pass the real validator
+    accepted = np.flatnonzero(
+        MockSamplingParams.validate_grid(np.array(rows, dtype=float))
+    )
+
+    assert len(accepted) == 1620
+    for index in accepted:
+        MockSamplingParams(**dict(zip(columns, rows[index])))